@@ -58,12 +58,12 @@ class EditionParser(ABC):
     config: EditionConfig
     raw_data: EditionData
     edition_type: EditionType
-    possible_refs: set[str]
+    possible_refs: frozenset[str]
 
     def __init__(self, config: EditionConfig, data: EditionData) -> None:
         self.raw_data: EditionData = data
         self.config: EditionConfig = config
-        self.possible_refs: set[str] = fetch_possible_refs()
+        self.possible_refs: frozenset[str] = fetch_possible_refs()
 
     # --- operations on whole edition
     def _create_edition_skeleton(self) -> Edition:
@@ -259,22 +259,25 @@ class EditionParser(ABC):
 
         # Leaves with content
         else:
-            # Only store segment_id if it has matching markup (prune empty strings)
-            _segment_ids: list[str] = [
-                _id for _id, _markup in node.mainmatter.markup.items() if _markup
-            ]  # type: ignore
+            _markups: dict[str, str] = node.mainmatter.markup  # type: ignore
+            _main_text: dict[str, str] = node.mainmatter.main_text  # type: ignore
+            _notes: dict[str, str] = node.mainmatter.notes or {}
+            _references: dict[str, str] = node.mainmatter.reference or {}
 
             single_lines: list[str] = []
 
-            for _id in _segment_ids:
+            # Only process segment_id if it has matching markup (prune empty strings)
+            for _id, _markup in _markups.items():
+                if not _markup:
+                    continue
                 try:
                     single_lines.append(
                         process_line(
-                            markup=node.mainmatter.markup[_id],
+                            markup=_markup,
                             segment_id=_id,
-                            text=node.mainmatter.main_text.get(_id, ""),
-                            note=node.mainmatter.notes.get(_id, "") if node.mainmatter.notes else "",
-                            references=node.mainmatter.reference.get(_id, "") if node.mainmatter.reference else "",
+                            text=_main_text.get(_id, ""),
+                            note=_notes.get(_id, ""),
+                            references=_references.get(_id, ""),
                             possible_refs=self.possible_refs,
                         )
                     )
@@ -82,9 +82,8 @@ class EpubEdition(LatexParser):
         book.add_item(chapter)
         book.spine.append(chapter)
 
-    def _split_mainmatter(self, mainmatter: str) -> list[BeautifulSoup]:
-        _html: BeautifulSoup = BeautifulSoup(mainmatter, "lxml")
-        for _tag in _html.find("body").children:
+    def _split_mainmatter(self, html: BeautifulSoup) -> list[BeautifulSoup]:
+        for _tag in html.find("body").children:
 
             if (
                 _tag.name
@@ -98,7 +97,7 @@ class EpubEdition(LatexParser):
             ):
                 _tag.insert_after("//split")
 
-        _mainmatter = extract_string(_html)
+        _mainmatter = extract_string(html)
         return [BeautifulSoup(_part, "lxml") for _part in _mainmatter.split("//split")]
 
     def _get_mainmatter_uids(self) -> list[list[str]]:
@@ -158,12 +157,13 @@ class EpubEdition(LatexParser):
 
     @no_type_check
     def _process_links(self, links: list[Tag], chapter_name: str = "") -> None:
+        # links to uids missing from the mapping point to the first uid
+        _mapping: dict[str, str] = self.mainmatter_uids_mapping
+        if links and not chapter_name and not _mapping:
+            raise ValueError("Cannot resolve links, mainmatter uids mapping is empty.")
+        _default: str = next(iter(_mapping), "")
         for _tag in links:
-            _target: str = (
-                chapter_name
-                if chapter_name
-                else self.mainmatter_uids_mapping.get(_tag["href"][1:], list(self.mainmatter_uids_mapping.keys())[0])
-            )
+            _target: str = chapter_name if chapter_name else _mapping.get(_tag["href"][1:], _default)
             _tag["href"] = f'{_target}.xhtml{_tag["href"]}'
 
     def _set_mainmatter_chapter(self, book: EpubBook, html: BeautifulSoup, volume: Volume, uids: list[str]) -> None:
@@ -201,11 +201,14 @@ class EpubEdition(LatexParser):
         # add halftitle page image
         self._add_image(book=book, file_path=self.IMAGES_DIR / "sclogo.png")
 
+        # parse mainmatter
+        _mainmatter_html = BeautifulSoup(volume.mainmatter, "lxml")
+        self.sutta_depth = find_sutta_title_depth(html=_mainmatter_html)
+
         # divide mainmatter into separate chapters
-        self.volume_mainmatter = self._split_mainmatter(mainmatter=volume.mainmatter)
+        self.volume_mainmatter = self._split_mainmatter(html=_mainmatter_html)
 
         # prepare helper data
-        self.sutta_depth = find_sutta_title_depth(html=BeautifulSoup(volume.mainmatter, "lxml"))
         self.mainmatter_uids = self._get_mainmatter_uids()
         self.mainmatter_uids_mapping = self._make_mainmatter_uids_mapping()
 
@@ -1,8 +1,10 @@
 import ast
+import itertools
 import logging
 import os
 import re
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast, no_type_check
 from zipfile import ZipFile
@@ -15,48 +17,57 @@ from sutta_publisher.shared.value_objects.edition_data import Node
 from sutta_publisher.shared.value_objects.parser_objects import ToCHeading, Volume
 
 ALL_REFERENCES_URL = os.getenv("ALL_REFERENCES_URL", "")
-ACCEPTED_REFERENCES = ast.literal_eval(os.getenv("ACCEPTED_REFERENCES", ""))
+ACCEPTED_REFERENCES: frozenset[str] = frozenset(ast.literal_eval(os.getenv("ACCEPTED_REFERENCES", "")))
+HEADING_IN_NAME_PATTERN = re.compile(r"h\d+")
+HEADING_NAME_PATTERN = re.compile(r"^h\d+$")
 MAX_HEADING_DEPTH = 6
+NOTEREF_ANCHOR = "<a href='#note-{number}' id='noteref-{number}' role='doc-noteref' epub:type='noteref'>{number}</a> "
 SUTTACENTRAL_URL = os.getenv("SUTTACENTRAL_URL", "")
 TEMP_DIR = Path(tempfile.gettempdir())
 
 
-def fetch_possible_refs() -> set[str]:
+def fetch_possible_refs() -> frozenset[str]:
     response = requests.get(ALL_REFERENCES_URL)
     jsons_list = response.json()
     irregular_list_of_refs = [json["includes"] for json in jsons_list]
-    return set(_flatten_list(irregular_list_of_refs))
+    return frozenset(_flatten_list(irregular_list_of_refs))
 
 
-def _filter_refs(references: list[tuple[str, str]], accepted_references: list[str]) -> list[tuple[str, str]]:
+def _filter_refs(references: list[tuple[str, str]], accepted_references: frozenset[str]) -> list[tuple[str, str]]:
     """Filter out unaccepted references from a list."""
     return [value for value in references if value[0] in accepted_references]
 
 
 def _flatten_list(irregular_list: list[Any]) -> list[Any]:
-    flat_list = []
-    for element in irregular_list:
-        if isinstance(element, list):
-            for item in element:
-                flat_list.append(item)
-        else:
-            flat_list.append(element)
-    return flat_list
+    """Flatten a list, which elements are either single items or lists of items, e.g. `["ms", ["bj", "vnp"]]`."""
+    return list(itertools.chain.from_iterable(_el if isinstance(_el, list) else (_el,) for _el in irregular_list))
+
+
+@lru_cache(maxsize=None)
+def _compile_reference_pattern(possible_refs: frozenset[str]) -> re.Pattern[str]:
+    """Compile a single pattern matching a reference of any of the possible types followed by its number.
+
+    A reference either starts the string or follows a comma, so the same pattern scans a whole "ref1, ref2" string.
+    """
+    # Longer ref types go first, so that e.g. "pts-vp-pli1ed5.2" is not taken for "pts-vp-pli" number "1"
+    _ref_types = "|".join(re.escape(_ref_type) for _ref_type in sorted(possible_refs, key=len, reverse=True))
+    return re.compile(rf"(?:^|,)\s*({_ref_types})(\d+\.?\d*)", flags=re.IGNORECASE)
+
+
+def _split_references(references: str, possible_refs: frozenset[str]) -> list[tuple[str, str]]:
+    """Split a string of references such as "bj7.1, ms3" into tuples e.g. `[("bj", "7.1"), ("ms", "3")]`.
 
+    Unknown references are skipped.
+    """
+    if not references or not possible_refs:
+        return []
 
-def _split_ref_and_number(reference: str, possible_refs: set[str]) -> tuple[str, str] | None:
-    """Split reference strings such as "bj7.1" into tuples e.g. `("bj", "7.1")`."""
-    # TODO: [28] Simplify and optimise this function
-    # Returns None for each ref type from POSSIBLE_REFS not present in reference string
-    matches = [re.match(rf"^({ref_type})(\d+\.?\d*)", reference, flags=re.IGNORECASE) for ref_type in possible_refs]
-    try:
-        # Select not None value from the list of matches, meaning a ref type is on a list of possible refs
-        match = [match for match in matches if match][0]
-        return match.group(1), match.group(2)
-    except IndexError:  # string doesn't match any of the POSSIBLE_REFs
-        return None
+    return [
+        (match.group(1), match.group(2)) for match in _compile_reference_pattern(possible_refs).finditer(references)
+    ]
 
 
+@lru_cache(maxsize=8192)
 def _reference_to_html(reference: tuple[str, str]) -> str:
     """Return HTML element made of a reference tuple i.e. `("bj", "7,9")`."""
     ref_type, ref_id = reference
@@ -64,27 +75,27 @@ def _reference_to_html(reference: tuple[str, str]) -> str:
     return f"<a class='{ref_type}' id='{ref_type}{ref_id}'>{ref_type.upper()} {ref_id}</a>"
 
 
-def process_line(markup: str, segment_id: str, text: str, note: str, references: str, possible_refs: set[str]) -> str:
+def process_line(
+    markup: str, segment_id: str, text: str, note: str, references: str, possible_refs: frozenset[str]
+) -> str:
     # add data-ref attribute to <p>, <ul>, <ol>, <dl> tags (#2417)
     for tag in ["<p", "<ul", "<ol", "<dl"]:
         if tag in markup:
             markup = markup.replace(tag, f"{tag} id='{segment_id}'")
 
     # references are passed as a string such as: "ref1, ref2, ref3"
-    split_references: list[str] = [r.strip() for r in references.split(",")]
-    references_divided_into_types_and_ids: list[tuple[str, str] | None] = [
-        _split_ref_and_number(reference=ref, possible_refs=possible_refs) for ref in split_references
-    ]
-
-    filtered_references = [ref for ref in references_divided_into_types_and_ids if ref]
+    references_divided_into_types_and_ids = _split_references(references=references, possible_refs=possible_refs)
     # filter out unaccepted references
-    filtered_references = _filter_refs(references=filtered_references, accepted_references=ACCEPTED_REFERENCES)
-    list_of_refs_tags: list[str] = [_reference_to_html(reference) for reference in filtered_references]
-    references_html = "".join(list_of_refs_tags)
+    filtered_references = _filter_refs(
+        references=references_divided_into_types_and_ids, accepted_references=ACCEPTED_REFERENCES
+    )
+    line_parts: list[str] = [_reference_to_html(reference) for reference in filtered_references]
     if note:
-        text = text.rstrip()
-        text += "<a href='#note-{number}' id='noteref-{number}' role='doc-noteref' epub:type='noteref'>{number}</a> "
-    return markup.format(f"{references_html}{text}")
+        line_parts.extend([text.rstrip(), NOTEREF_ANCHOR])
+    else:
+        line_parts.append(text)
+    # markup holds a single "{}" placeholder
+    return markup.replace("{}", "".join(line_parts), 1)
 
 
 def get_heading_depth(tag: Tag) -> int:
@@ -119,7 +130,7 @@ def find_sutta_title_depth(html: BeautifulSoup) -> int:
         int: Level of a found heading, None if didn't find any:
     """
     css_class: str = "range-title" if html.find(class_="range-title") else "sutta-title"
-    heading: Tag = html.find(name=re.compile(r"^h\d+$"), class_=css_class)
+    heading: Tag = html.find(name=HEADING_NAME_PATTERN, class_=css_class)
     return get_heading_depth(tag=heading)
 
 
@@ -156,11 +167,12 @@ def make_section_or_link(headings: list[ToCHeading], item: dict | str, mapping:
     """Create section (if has children) or link recursively"""
 
     # If heading has children
-    if isinstance(item, dict) and list(item.keys())[0] == headings[0].uid:
+    if isinstance(item, dict) and next(iter(item)) == headings[0].uid:
         _uid = mapping.get(headings[0].uid, headings[0].uid)
+        _children = next(iter(item.values()))
         return [
             _make_section(heading=headings.pop(0), uid=_uid),
-            [make_section_or_link(headings=headings, item=_item, mapping=mapping) for _item in list(item.values())[0]],
+            [make_section_or_link(headings=headings, item=_item, mapping=mapping) for _item in _children],
         ]
     # If no children
     elif isinstance(item, str) and item == headings[0].uid:
@@ -190,7 +202,7 @@ def increment_heading_by_number(by_number: int, heading: Tag) -> None:
 
 def find_all_headings(html: BeautifulSoup) -> list[Tag]:
     """Get a list of all hX element from HTML"""
-    return list(html.find_all(name=re.compile(r"h\d+")))
+    return list(html.find_all(name=HEADING_IN_NAME_PATTERN))
 
 
 def add_class(tags: list[Tag], class_: str) -> None:
@@ -276,28 +288,28 @@ def validate_node(node: Node) -> None:
 
     if node.type == "leaf":
 
-        if hasattr(node.mainmatter, "markup") and node.mainmatter.markup:
+        if _markups := node.mainmatter.markup:
 
             # Check if first markup in a node matches the node's uid
-            if f"id='{node.uid}'" not in next(iter(node.mainmatter.markup.values())):
+            if f"id='{node.uid}'" not in next(iter(_markups.values())):
                 _errors.append("segment uid and markup tag id do not match")
 
             # Check <h1> tags
-            _heading_ids = [_id for _id, _markup in node.mainmatter.markup.items() if "<h1" in _markup]
+            _heading_ids = list(itertools.islice((_id for _id, _markup in _markups.items() if "<h1" in _markup), 2))
             if not _heading_ids:
                 _errors.append("missing <h1> tag")
             elif len(_heading_ids) > 1:
                 _errors.append("too many <h1> tags")
             elif not node.mainmatter.main_text.get(_heading_ids[0]):
                 _errors.append("empty <h1> tag")
-            elif node.mainmatter.notes and node.mainmatter.notes.get(_heading_ids[0]):
+            elif (_notes := node.mainmatter.notes) and _notes.get(_heading_ids[0]):
                 _errors.append("<h1> tag should not have any children tags")
 
         else:
             _errors.append("markup is missing")
 
     # Check if node contains required attributes
-    _attrs = ["root_name"] + ["acronym" if node.type == "leaf" else "name"]
+    _attrs = ["root_name", "acronym" if node.type == "leaf" else "name"]
     _errors.extend([f"missing '{_attr}'" for _attr in _attrs if not getattr(node, _attr)])
 
     if _errors:
@@ -15,6 +15,8 @@ from .base import EditionParser
 
 log = logging.getLogger(__name__)
 
+LINE_INDENT_PATTERN = re.compile(r"^(\s*)", re.MULTILINE)
+
 
 class CustomTag(Tag):
     TAGS_TO_IGNORE = ["p", "h1", "h2", "h3", "h4", "h5", "h6", "address", "td"]
@@ -67,7 +69,7 @@ class HtmlEdition(EditionParser):
         """Returns prettified html with no indent and custom breakline conditions"""
         _element_classes = {Tag: CustomTag}
         _soup = BeautifulSoup(html, "lxml", element_classes=_element_classes)
-        return re.compile(r"^(\s*)", re.MULTILINE).sub("", _soup.prettify(formatter=None))
+        return LINE_INDENT_PATTERN.sub("", _soup.prettify(formatter=None))
 
     def generate_standalone_html(self, volume: Volume) -> None:
         log.debug("Generating a standalone html...")
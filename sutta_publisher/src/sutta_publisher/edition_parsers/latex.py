@@ -3,10 +3,12 @@ import logging
 import os
 import re
 from copy import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, cast, no_type_check
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, cast, no_type_check
 
-from bs4 import BeautifulSoup, NavigableString, PageElement, Tag
+from bs4 import BeautifulSoup, NavigableString, PageElement, SoupStrainer, Tag
 from jinja2 import Environment as jinja2_Environment, FileSystemLoader, Template, TemplateNotFound
 from pylatex import Description, Document, Enumerate, Itemize, NewPage, NoEscape
 from pylatex.base_classes import Command, Environment
@@ -27,22 +29,44 @@ log = logging.getLogger(__name__)
 
 ADDITIONAL_PANNASAKA_IDS: list[str] = ast.literal_eval(os.getenv("ADDITIONAL_PANNASAKA_IDS", ""))
 COVER_TEMPLATES_MAPPING: dict[str, str] = ast.literal_eval(os.getenv("COVER_TEMPLATES_MAPPING", ""))
+DOCUMENT_OPTION_VARIABLE_PATTERN = re.compile(r"{(\w+)}")  # e.g. "coverheight={page_height}"
 FOREIGN_SCRIPT_MACRO_LANGUAGES: list[str] = ast.literal_eval(os.getenv("FOREIGN_SCRIPT_MACRO_LANGUAGES", ""))
 INDIVIDUAL_TEMPLATES_MAPPING: dict[str, list] = ast.literal_eval(os.getenv("INDIVIDUAL_TEMPLATES_MAPPING", ""))
+# braces and backslashes are left alone, \textsanskrit{} is inserted into the text before it is escaped
+LATEX_ESCAPE_TABLE = str.maketrans(
+    {"#": "\\#", "$": "\\$", "%": "\\%", "&": "\\&", "_": "\\_", "~": "\\textasciitilde"}
+)
 LATEX_TEMPLATES_MAPPING: dict[str, str] = ast.literal_eval(os.getenv("LATEX_TEMPLATES_MAPPING", ""))
-MATTERS_TO_SKIP: list[str] = ast.literal_eval(os.getenv("MATTERS_TO_SKIP", ""))
+MATTERS_TO_SKIP: frozenset[str] = frozenset(ast.literal_eval(os.getenv("MATTERS_TO_SKIP", "")))
 MATTERS_WITH_TEX_TEMPLATES: list[str] = ast.literal_eval(os.getenv("MATTERS_WITH_TEX_TEMPLATES", ""))
+PAGE_WIDTH_NUMBER_PATTERN = re.compile(r"^\d+")
 SANSKRIT_LANGUAGES: list[str] = ast.literal_eval(os.getenv("SANSKRIT_LANGUAGES", ""))
 SANSKRIT_PATTERN = re.compile(r"\b(?=\w*[āīūṭḍṁṅñṇḷśṣṛ])\w+\b")
-STYLING_CLASSES: list[str] = ast.literal_eval(os.getenv("STYLING_CLASSES", ""))
+STYLING_CLASSES: frozenset[str] = frozenset(ast.literal_eval(os.getenv("STYLING_CLASSES", "")))
 SUTTATITLES_WITHOUT_TRANSLATED_TITLE: list[str] = ast.literal_eval(
     os.getenv("SUTTATITLES_WITHOUT_TRANSLATED_TITLE", "")
 )
+SUTTA_OR_RANGE_TITLE_CLASSES: frozenset[str] = frozenset({"sutta-title", "range-title"})
 TEXTS_WITH_CHAPTER_SUTTA_TITLES: dict[str, str | tuple] = ast.literal_eval(
     os.getenv("TEXTS_WITH_CHAPTER_SUTTA_TITLES", "")
 )
 
 
+@lru_cache(maxsize=16384)
+def _convert_text_to_tex(text: str, mark_sanskrit: bool) -> str:
+    """Wrap Pali and Sanskrit words with \\textsanskrit (if requested) and escape LaTeX special characters."""
+    if mark_sanskrit:
+        text = SANSKRIT_PATTERN.sub(r"\\textsanskrit{\g<0>}", text)
+    return text.translate(LATEX_ESCAPE_TABLE)
+
+
+def _is_endnotes_id(id_: str | None) -> bool:
+    return id_ is not None and "-endnotes" in id_
+
+
+ENDNOTES_STRAINER = SoupStrainer(id=_is_endnotes_id)
+
+
 class CustomEnumerate(Enumerate):
     _latex_name = "enumerate"
 
@@ -72,10 +96,7 @@ class LatexParser(EditionParser):
 
     @staticmethod
     def _is_styled(tag: Tag) -> bool:
-        if tag.has_attr("class"):
-            return any(_class in STYLING_CLASSES for _class in tag["class"])
-        else:
-            return False
+        return not STYLING_CLASSES.isdisjoint(tag.get("class", ()))
 
     @staticmethod
     def _apply_styling(tag: Tag, tex: str) -> str:
@@ -112,13 +133,13 @@ class LatexParser(EditionParser):
         return cast(str, tex + NoEscape("\n\n"))
 
     def _append_span(self, tag: Tag) -> str:
-        if tag.has_attr("class"):
-            if all(_class in tag["class"] for _class in ["blurb-item", "root-title"]):
+        if _classes := tag.get("class"):
+            if "blurb-item" in _classes and "root-title" in _classes:
                 return f"({self._append_italic(tag=tag)})"
             else:
                 tex: str = self._process_contents(contents=tag.contents)
 
-                if all(_class in tag["class"] for _class in ["blurb-item", "acronym"]):
+                if "blurb-item" in _classes and "acronym" in _classes:
                     return f"{tex}: "
 
                 tex = LatexParser._apply_styling(tag=tag, tex=tex)
@@ -275,10 +296,6 @@ class LatexParser(EditionParser):
         elif self.section_type == "chapter":
             return cast(str, LatexParser._append_custom_part(tag=tag))
         else:
-            actions: list[Callable] = [
-                LatexParser._append_custom_part,
-                LatexParser._append_custom_chapter,
-            ]
             _heading_depth: int = get_heading_depth(tag)
 
             # Samyutta only - move all headings one level up in order to remove the top level heading
@@ -294,20 +311,16 @@ class LatexParser(EditionParser):
             else:
                 index = -1
 
-            return cast(str, actions[index](tag=tag))
+            return cast(str, getattr(self, LatexParser._SECTION_TITLE_HANDLERS[index])(tag=tag))
 
     def _append_subheading(self, tag: Tag) -> str:
-        actions: list[Callable] = [
-            self._append_subsection,
-            self._append_subsubsection,
-            self._append_paragraph,
-            self._append_subparagraph,
-        ]
-        if self.section_type == "chapter":
-            actions.insert(0, self._append_section)
-
+        actions = (
+            LatexParser._CHAPTER_SUBHEADING_HANDLERS
+            if self.section_type == "chapter"
+            else LatexParser._SUBHEADING_HANDLERS
+        )
         index = int(tag.name[1]) - self.sutta_depth - 1
-        return cast(str, actions[index](tag=tag))
+        return cast(str, getattr(self, actions[index])(tag=tag))
 
     @staticmethod
     def _append_tableofcontents() -> str:
@@ -367,39 +380,91 @@ class LatexParser(EditionParser):
         return cast(str, tex + NoEscape("\n\n"))
 
     def _append_heading(self, tag: Tag) -> str:
-        actions: list[Callable] = [
-            self._append_chapter,
-            self._append_section,
-            self._append_subsection,
-            self._append_subsubsection,
-            self._append_paragraph,
-            self._append_subparagraph,
-        ]
         _depth: int = get_heading_depth(tag)
-        return cast(str, actions[_depth - 1](tag=tag))
+        return cast(str, getattr(self, LatexParser._HEADING_HANDLERS[_depth - 1])(tag=tag))
 
     def _is_gatha(self, tag: Tag) -> bool:
-        return tag.has_attr("class") and any(_class in ["gatha"] for _class in tag["class"])
+        return "gatha" in tag.get("class", ())
 
     def _is_uddanagatha(self, tag: Tag) -> bool:
-        return tag.has_attr("class") and any(_class in ["uddanagatha"] for _class in tag["class"])
+        return "uddanagatha" in tag.get("class", ())
 
     def _is_range_or_sutta_title(self, tag: Tag) -> bool:
+        _classes = tag.get("class", ())
         return (
-            tag.has_attr("class")
-            and "heading" in tag["class"]
-            and any(_class in tag["class"] for _class in ["sutta-title", "range-title"])
+            "heading" in _classes
+            and not SUTTA_OR_RANGE_TITLE_CLASSES.isdisjoint(_classes)
             and int(tag.name[1:]) == self.sutta_depth
         )
 
     def is_element_to_skip(self, tag: Tag) -> bool:
-        return (tag.has_attr("class") and any([class_ in tag["class"] for class_ in MATTERS_TO_SKIP])) or (
-            tag.has_attr("id") and any([id_ in tag["id"] for id_ in MATTERS_TO_SKIP])
-        )
+        if (_classes := tag.get("class")) and not MATTERS_TO_SKIP.isdisjoint(_classes):
+            return True
+        return bool(_id := tag.get("id")) and any(_matter in _id for _matter in MATTERS_TO_SKIP)
+
+    def _append_anchor(self, tag: Tag) -> str:
+        if tag.has_attr("role") and "doc-noteref" in tag["role"]:
+            return self._append_footnote()
+        elif tag.has_attr("href") and (not tag.has_attr("class") or "blurb-link" not in tag["class"]):
+            return self._append_href(tag=tag)
+        return self._process_contents(contents=tag.contents)
+
+    def _append_article(self, tag: Tag) -> str:
+        if tag.has_attr("class") and "epigraph" in tag["class"]:
+            return self._append_epigraph(tag=tag)
+        return self._process_contents(contents=tag.contents)
+
+    def _append_blockquote(self, tag: Tag) -> str:
+        if self._is_gatha(tag=tag):
+            return self._append_verse(tag=tag)
+        elif self._is_uddanagatha(tag=tag):
+            return self._append_scuddana(tag=tag)
+        return self._append_quotation(tag=tag)
+
+    def _append_section_element(self, tag: Tag) -> str:
+        if tag.has_attr("id") and tag["id"] == "main-toc":
+            return LatexParser._append_tableofcontents()
+        return self._process_contents(contents=tag.contents)
+
+    # Names of handlers of tags, which are processed based on their name only. Tags not listed here just have their
+    # contents processed. See `_process_tag`.
+    _TAG_HANDLERS: Mapping[str, str] = MappingProxyType(
+        {
+            "a": "_append_anchor",
+            "article": "_append_article",
+            "b": "_append_bold",
+            "blockquote": "_append_blockquote",
+            "cite": "_append_italic",
+            "dl": "_append_description",
+            "em": "_append_emphasis",
+            "i": "_append_italic",
+            "j": "_append_enjambment",
+            "ol": "_append_enumerate",
+            "p": "_append_p",
+            "section": "_append_section_element",
+            "span": "_append_span",
+            "ul": "_append_itemize",
+        }
+    )
+
+    # Names of heading handlers by depth: section titles, headings from h1, and subheadings below the sutta title
+    _SECTION_TITLE_HANDLERS: tuple[str, ...] = ("_append_custom_part", "_append_custom_chapter")
+    _HEADING_HANDLERS: tuple[str, ...] = (
+        "_append_chapter",
+        "_append_section",
+        "_append_subsection",
+        "_append_subsubsection",
+        "_append_paragraph",
+        "_append_subparagraph",
+    )
+    _SUBHEADING_HANDLERS: tuple[str, ...] = _HEADING_HANDLERS[2:]
+    _CHAPTER_SUBHEADING_HANDLERS: tuple[str, ...] = _HEADING_HANDLERS[1:]
 
     def _process_tag(self, tag: Tag | PageElement) -> str:
+        _name: str = tag.name
+        _classes: list[str] = tag.get("class", [])
 
-        match tag.name:
+        match _name:
 
             case tag_to_skip if self.is_element_to_skip(tag=tag):
                 return ""
@@ -407,92 +472,43 @@ class LatexParser(EditionParser):
             case range_or_sutta_title if self._is_range_or_sutta_title(tag=tag):
                 return self._append_sutta_title(tag=tag)
 
-            case section_title if tag.has_attr("class") and "section-title" in tag["class"]:
+            case section_title if "section-title" in _classes:
                 return self._append_section_title(tag=tag)
 
-            case subheading if tag.has_attr("class") and "subheading" in tag["class"]:
+            case subheading if "subheading" in _classes:
                 return self._append_subheading(tag=tag)
 
-            case heading if tag.name.startswith("h") and tag.name[1].isnumeric():
+            case heading if _name.startswith("h") and _name[1].isnumeric():
                 return self._append_heading(tag=tag)
 
-            case macro_lang if tag.has_attr("lang") and tag["lang"] in FOREIGN_SCRIPT_MACRO_LANGUAGES:
+            case macro_lang if tag.get("lang") in FOREIGN_SCRIPT_MACRO_LANGUAGES:
                 return self._append_foreign_script_macro(tag=tag)
 
-            case "a" if tag.has_attr("role") and "doc-noteref" in tag["role"]:
-                return self._append_footnote()
-
-            case "a" if tag.has_attr("href") and (not tag.has_attr("class") or "blurb-link" not in tag["class"]):
-                return self._append_href(tag=tag)
-
-            case "article" if tag.has_attr("class") and "epigraph" in tag["class"]:
-                return self._append_epigraph(tag=tag)
-
-            case "b":
-                return self._append_bold(tag=tag)
-
-            case "blockquote" if self._is_gatha(tag=tag):
-                return self._append_verse(tag=tag)
-
-            case "blockquote" if self._is_uddanagatha(tag=tag):
-                return self._append_scuddana(tag=tag)
-
-            case "blockquote":
-                return self._append_quotation(tag=tag)
-
             case "br":
                 return LatexParser._append_breakline()
 
-            case "cite":
-                return self._append_italic(tag=tag)
-
-            case "dl":
-                return self._append_description(tag=tag)
-
-            case "em":
-                return self._append_emphasis(tag=tag)
-
             case "hr":
                 return LatexParser._append_thematic_break()
 
-            case "i" if tag.has_attr("lang"):
-                return self._append_italic(tag=tag)
-
-            case "i":
-                return self._append_italic(tag=tag)
-
-            case "j":
-                return self._append_enjambment(tag=tag)
-
-            case "ol":
-                return self._append_enumerate(tag=tag)
-
-            case "p":
-                return self._append_p(tag=tag)
-
-            case "section" if tag.has_attr("id") and tag["id"] == "main-toc":
-                return LatexParser._append_tableofcontents()
-
-            case "span":
-                return self._append_span(tag=tag)
-
-            case "ul":
-                return self._append_itemize(tag=tag)
+        if _handler := LatexParser._TAG_HANDLERS.get(_name):
+            return cast(str, getattr(self, _handler)(tag=tag))
 
         return self._process_contents(contents=tag.contents)
 
     def _process_contents(self, contents: list[PageElement]) -> str:
-        tex: str = ""
+        tex: list[str] = []
+        # contents share a parent, its classes decide whether to mark Sanskrit words
+        _mark_sanskrit: bool | None = None
 
         for _element in contents:
             if isinstance(_element, Tag):
-                tex += self._process_tag(tag=_element)
+                tex.append(self._process_tag(tag=_element))
             elif isinstance(_element, NavigableString) and _element != "\n":
-                if not (_element.parent.has_attr("class") and "sutta-heading" in _element.parent["class"]):
-                    _element = re.sub(SANSKRIT_PATTERN, r"\\textsanskrit{\g<0>}", _element)
-                tex += _element.replace("&", "\\&").replace("_", "\\_").replace("~", "\\textasciitilde")
+                if _mark_sanskrit is None:
+                    _mark_sanskrit = "sutta-heading" not in _element.parent.get("class", ())
+                tex.append(_convert_text_to_tex(text=str(_element), mark_sanskrit=_mark_sanskrit))
 
-        return cast(str, NoEscape(tex))
+        return cast(str, NoEscape("".join(tex)))
 
     @staticmethod
     def _strip_tag_string(tag: Tag) -> None:
@@ -501,6 +517,7 @@ class LatexParser(EditionParser):
                 _element.string.replace_with(_element.string.strip())
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _get_shared_template(name: str) -> Template:
         if not LATEX_TEMPLATES_MAPPING:
             raise EnvironmentError(
@@ -681,28 +698,26 @@ class LatexParser(EditionParser):
         with open(file=_path, mode="wt") as f:
             f.write(_output)
 
-    def _collect_endnotes(self, volume: Volume) -> list[str]:
+    @staticmethod
+    def _extract_matter_endnotes(matters: list[str]) -> list[str]:
         endnotes = []
-        for _matter in volume.frontmatter:
-            # Look for any tag with 'endnotes' in id attribute
-            _html_endnotes = BeautifulSoup(_matter, "lxml").find(id=lambda x: x and "-endnotes" in x)
+        for _matter in matters:
+            # Look for any tag with 'endnotes' in id attribute, build the soup only for that tag and its children
+            _html_endnotes = BeautifulSoup(_matter, "lxml", parse_only=ENDNOTES_STRAINER).find(id=_is_endnotes_id)
             if _html_endnotes:
                 for _endnote in _html_endnotes.find_all("li"):
                     # get what is inside <p> tag without the last element, an anchor tag
                     _endnote_contents = _endnote.p.contents[:-1]
                     endnotes.append("".join(str(_el) for _el in _endnote_contents))
+        return endnotes
+
+    def _collect_endnotes(self, volume: Volume) -> list[str]:
+        endnotes = LatexParser._extract_matter_endnotes(matters=volume.frontmatter)
 
         if volume.endnotes:
             endnotes.extend(volume.endnotes)
 
-        for _matter in volume.backmatter:
-            # Look for any tag with 'endnotes' in id attribute
-            _html_endnotes = BeautifulSoup(_matter, "lxml").find(id=lambda x: x and "-endnotes" in x)
-            if _html_endnotes:
-                for _endnote in _html_endnotes.find_all("li"):
-                    # get what is inside <p> tag without the last element, an anchor tag
-                    _endnote_contents = _endnote.p.contents[:-1]
-                    endnotes.append("".join(str(_el) for _el in _endnote_contents))
+        endnotes.extend(LatexParser._extract_matter_endnotes(matters=volume.backmatter))
 
         # Since we use raw volume endnotes, we have to ensure that possible links are absolute
         endnotes = list(map(make_absolute_links, endnotes))
@@ -753,11 +768,13 @@ class LatexParser(EditionParser):
 
         for _option in document_config["document_options"]:
 
-            if not (_match := re.search(r"{(\w+)}", _option)) or getattr(volume, _match.group(1)):
+            if not (_match := DOCUMENT_OPTION_VARIABLE_PATTERN.search(_option)) or getattr(volume, _match.group(1)):
 
                 # Divide page width by 2 in epub editions
                 if self.config.edition.publication_type == "epub" and _match and _match.group(1) == "page_width":
-                    _epub_page_width = re.sub(r"^\d+", lambda x: str(int(x.group(0)) // 2), volume.page_width)
+                    _epub_page_width = PAGE_WIDTH_NUMBER_PATTERN.sub(
+                        lambda x: str(int(x.group(0)) // 2), volume.page_width
+                    )
                     _processed_options.append(_option.format(**{_match.group(1): _epub_page_width}))
 
                 else:
@@ -26,8 +26,16 @@ def get_edition_ids(api_key: str, publication_numbers: str) -> list[str]:
     return edition_ids
 
 
-def get_edition_config(edition_id: str) -> EditionConfig:
-    """Fetch config for a given edition."""
+def get_creators_bios() -> list[dict[str, str]]:
+    """Fetch biographies of all creators."""
+    bios_response = requests.get(CREATOR_BIOS_URL)
+    bios_response.raise_for_status()
+    creators_bios: list[dict[str, str]] = bios_response.json()
+    return creators_bios
+
+
+def get_edition_config(edition_id: str, creators_bios: list[dict[str, str]] | None = None) -> EditionConfig:
+    """Fetch config for a given edition. Creators' biographies are fetched too, unless they are given."""
     response = requests.get(API_URL + API_ENDPOINTS["specific_edition"].format(edition_id=edition_id))
     response.raise_for_status()
     payload = response.content.decode("utf-8")
@@ -35,9 +43,8 @@ def get_edition_config(edition_id: str) -> EditionConfig:
     config = EditionConfig.parse_raw(payload)
 
     # We need to set creator_bio separately as it comes from a different source
-    bios_response = requests.get(CREATOR_BIOS_URL)
-    bios_response.raise_for_status()
-    creators_bios: list[dict[str, str]] = bios_response.json()
+    if creators_bios is None:
+        creators_bios = get_creators_bios()
     try:
         (target_bio,) = [bio for bio in creators_bios if bio["creator_uid"] == config.publication.creator_uid]
         config.publication.creator_bio = target_bio["creator_biography"]
@@ -54,9 +61,10 @@ def get_edition_configs(api_key: str, publication_numbers: str) -> EditionsConfi
     editions_id: list[str] = get_edition_ids(api_key=api_key, publication_numbers=publication_numbers)
 
     editions_config = EditionsConfigs()
+    creators_bios: list[dict[str, str]] = get_creators_bios() if editions_id else []
     for each_id in editions_id:
         try:
-            editions_config.append(get_edition_config(edition_id=each_id))
+            editions_config.append(get_edition_config(edition_id=each_id, creators_bios=creators_bios))
         except ValidationError as err:
             messages = [f"Unsupported edition found: '{each_id}'. Skipping to next one. Details:"]
             for idx, error in enumerate(err.errors()):
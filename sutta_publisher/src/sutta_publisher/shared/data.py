@@ -32,7 +32,7 @@ def get_text_type(text_uid: str, super_tree: list[dict]) -> str | NoReturn:
     """Get type of given text"""
     for item in super_tree:
         if f"'{text_uid}'" in str(item):
-            text_type: str = list(item.keys())[0]
+            text_type: str = next(iter(item))
             return text_type
 
     # If uid not found, we stop the app as we cannot get the structure tree
@@ -43,8 +43,9 @@ def get_depths(tree: list[dict | str], depths: dict[str, int], initial_depth: in
     """Get all headings depth recursively"""
     for item in tree:
         if isinstance(item, dict):
-            depths[list(item.keys())[0]] = initial_depth
-            _tree = list(item.values())[0]
+            # Tree nodes are single-key dicts
+            _uid, _tree = next(iter(item.items()))
+            depths[_uid] = initial_depth
             get_depths(_tree, depths, initial_depth=initial_depth + 1)
         elif isinstance(item, str):
             depths[item] = initial_depth
@@ -55,7 +56,7 @@ def _get_volume_tree(tree: list[dict], uid: str) -> list[dict] | None:
         if uid in item:
             return [item]
         elif isinstance(item, dict):
-            _tree = _get_volume_tree(tree=list(item.values())[0], uid=uid)
+            _tree = _get_volume_tree(tree=next(iter(item.values())), uid=uid)
             if _tree:
                 return _tree
     return None
@@ -73,9 +74,10 @@ def get_tree(uid: str, tree: list[dict]) -> dict | str | None:
         if item == uid:
             return item
         elif isinstance(item, dict):
-            if list(item.keys())[0] == uid:
+            _item_uid, _tree = next(iter(item.items()))
+            if _item_uid == uid:
                 return item
-            elif _item := get_tree(uid=uid, tree=list(item.values())[0]):
+            elif _item := get_tree(uid=uid, tree=_tree):
                 return _item
     return None
 
@@ -47,10 +47,10 @@ def get_all_uids(tree: list[dict | str], text_uid: str) -> list[str] | None:
         if isinstance(item, str) and item == text_uid:
             return [text_uid]
         elif isinstance(item, dict):
-            if list(item.keys())[0] == text_uid:
+            if next(iter(item)) == text_uid:
                 uids: list[str] = [text_uid] + item[text_uid]
                 return uids
-            elif _item := get_all_uids(tree=list(item.values())[0], text_uid=text_uid):
+            elif _item := get_all_uids(tree=next(iter(item.values())), text_uid=text_uid):
                 return _item
 
     return None
@@ -17,6 +17,7 @@ log = logging.getLogger(__name__)
 
 MAX_GITHUB_REQUEST_ERRORS = 3
 ERROR_SLEEP_TIME = 1  # in seconds
+FILENAME_PATTERN = re.compile(r"([A-Za-z-]+-)(?:\d+-\d+-+\d+)(-\d+)?(-cover)?(.[a-z]+)")
 
 
 def worker(queue: list[dict], api_key: str = None, silent: bool = False) -> list[Response]:
@@ -93,11 +94,10 @@ def get_blob_shas(file_paths: list[Path], repo_url: str, api_key: str) -> list[s
 def match_file(filename: str, content: list[dict]) -> dict:
     """Return a dict with matching file details. Return empty dict if file not found."""
 
-    _PATTERN = r"([A-Za-z-]+-)(?:\d+-\d+-+\d+)(-\d+)?(-cover)?(.[a-z]+)"
-    _new_file_match = re.search(_PATTERN, filename)
+    _new_file_match = FILENAME_PATTERN.search(filename)
 
     for _file in content:
-        _old_file_match = re.search(_PATTERN, _file.get("name", ""))
+        _old_file_match = FILENAME_PATTERN.search(_file.get("name", ""))
         if _new_file_match and _old_file_match and _new_file_match.groups() == _old_file_match.groups():
             return _file
 
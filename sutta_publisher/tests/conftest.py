@@ -21,7 +21,8 @@ def repo_url() -> str:
     return "https://github.com/someowner/somerepo/contents/"
 
 
-@pytest.fixture
+# Fixtures below are built once per session, tests must not mutate them
+@pytest.fixture(scope="session")
 def editions() -> list[dict]:
     return [
         {"edition_id": "snp-en-sujato_scpub17-ed2-epub_2022-02-10", "publication_number": "scpub17"},
@@ -29,7 +30,7 @@ def editions() -> list[dict]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def publications() -> set[tuple]:
     return {
         ("scpub17", "en", "sujato", ("snp",)),
@@ -50,7 +51,7 @@ def publications() -> set[tuple]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def super_tree() -> list[dict]:
     return [
         {
@@ -0,0 +1,33 @@
+import pytest
+
+_ALL_REFS: tuple[str, ...] = (
+    "ms",
+    "pts-cs",
+    "pts-vp-pli",
+    "pts-vp-pli1ed",
+    "pts-vp-pli2ed",
+    "pts-vp-en",
+    "vnp",
+    "bj",
+    "csp1ed",
+    "csp2ed",
+    "csp3ed",
+    "dr",
+    "mc",
+    "mr",
+    "si",
+    "km",
+    "lv",
+    "ndp",
+    "cck",
+    "sya1ed",
+    "sya2ed",
+    "sya-all",
+    "vri",
+    "maku",
+)
+
+
+@pytest.fixture(scope="session")
+def list_of_all_refs() -> frozenset[str]:
+    return frozenset(_ALL_REFS)
@@ -1,6 +1,8 @@
+from unittest import mock
+
 import pytest
 
-from sutta_publisher.shared.config import get_edition_configs
+from sutta_publisher.shared.config import get_edition_config, get_edition_configs
 from sutta_publisher.shared.value_objects.edition import EditionType
 
 
@@ -45,3 +47,32 @@ def test_should_raise_for_missing_publication_number() -> None:
 
     with pytest.raises(ValueError):
         get_edition_configs(api_key="foo", publication_numbers=publication_number)
+
+
+_CREATORS_BIOS = [{"creator_uid": "sujato", "creator_biography": "Bhikkhu Sujato is a monk."}]
+
+
+@mock.patch("sutta_publisher.shared.config.get_edition_config")
+@mock.patch("sutta_publisher.shared.config.get_creators_bios", return_value=_CREATORS_BIOS)
+@mock.patch("sutta_publisher.shared.config.get_edition_ids", return_value=["edition-1", "edition-2", "edition-3"])
+def test_should_fetch_creators_bios_once_for_all_editions(mock_ids, mock_bios, mock_config) -> None:
+    editions = get_edition_configs(api_key="foo", publication_numbers="scpub3")
+
+    assert len(editions) == 3
+    mock_bios.assert_called_once_with()
+    assert mock_config.call_args_list == [
+        mock.call(edition_id=_edition_id, creators_bios=_CREATORS_BIOS)
+        for _edition_id in ("edition-1", "edition-2", "edition-3")
+    ]
+
+
+@mock.patch("sutta_publisher.shared.config.EditionConfig")
+@mock.patch("sutta_publisher.shared.config.requests.get")
+def test_should_not_fetch_creators_bios_when_given(mock_get, mock_edition_config) -> None:
+    mock_edition_config.parse_raw.return_value.publication.creator_uid = "sujato"
+
+    config = get_edition_config(edition_id="edition-1", creators_bios=_CREATORS_BIOS)
+
+    # only the edition itself is requested
+    mock_get.assert_called_once()
+    assert config.publication.creator_bio == "Bhikkhu Sujato is a monk."
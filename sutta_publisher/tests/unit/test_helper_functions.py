@@ -8,7 +8,7 @@ from sutta_publisher.edition_parsers.helper_functions import (
     _filter_refs,
     _flatten_list,
     _reference_to_html,
-    _split_ref_and_number,
+    _split_references,
     fetch_possible_refs,
     generate_html_toc,
     make_absolute_links,
@@ -19,49 +19,30 @@ from sutta_publisher.edition_parsers.helper_functions import (
 from sutta_publisher.shared.value_objects.edition_data import Node, NodeDetails
 from sutta_publisher.shared.value_objects.parser_objects import ToCHeading
 
+# Tags for the parametrized cases below are created from a single soup
+_SOUP = BeautifulSoup(parser="lxml")
 
-def soup():
-    return BeautifulSoup(parser="lxml")
-
-
-@pytest.fixture
-def list_of_all_refs() -> set[str]:
-    return {
-        "ms",
-        "pts-cs",
-        "pts-vp-pli",
-        "pts-vp-pli1ed",
-        "pts-vp-pli2ed",
-        "pts-vp-en",
-        "vnp",
-        "bj",
-        "csp1ed",
-        "csp2ed",
-        "csp3ed",
-        "dr",
-        "mc",
-        "mr",
-        "si",
-        "km",
-        "lv",
-        "ndp",
-        "cck",
-        "sya1ed",
-        "sya2ed",
-        "sya-all",
-        "vri",
-        "maku",
-    }
+_EXPECTED_LINE_1 = "<p id='dn1:0.1'><a class='pts-vp-pli' id='pts-vp-pli14.2'>PTS-VP-PLI 14.2</a>lorem ipsum<a href='#note-{number}' id='noteref-{number}' role='doc-noteref' epub:type='noteref'>{number}</a> "
+_EXPECTED_LINE_2 = "<h1 class='sutta-title'><a class='bj' id='bj7.9'>BJ 7.9</a>dolor sit.<a href='#note-{number}' id='noteref-{number}' role='doc-noteref' epub:type='noteref'>{number}</a> </h1></header>"
 
 
 @pytest.mark.parametrize(
-    "test_reference, expected",
-    [("bj7.2", ("bj", "7.2")), ("pts-vp-pli14.2", ("pts-vp-pli", "14.2")), ("invalid-ref2.2", None), ("bj", None)],
+    "test_references, expected",
+    [
+        ("bj7.2", [("bj", "7.2")]),
+        ("pts-vp-pli14.2", [("pts-vp-pli", "14.2")]),
+        ("invalid-ref2.2", []),
+        ("bj", []),
+        ("bj7.2, pts-vp-pli14.2", [("bj", "7.2"), ("pts-vp-pli", "14.2")]),
+        ("invalid-ref2.2, ms3", [("ms", "3")]),
+        ("pts-vp-pli1ed5.2", [("pts-vp-pli1ed", "5.2")]),
+        ("", []),
+    ],
 )
-def test_should_check_creating_tuple_from_reference(
-    test_reference: str, expected: tuple[str, str] | None, list_of_all_refs: list[str]
+def test_should_split_references_string_into_tuples(
+    test_references: str, expected: list[tuple[str, str]], list_of_all_refs: frozenset[str]
 ) -> None:
-    assert _split_ref_and_number(test_reference, list_of_all_refs) == expected
+    assert _split_references(test_references, list_of_all_refs) == expected
 
 
 @pytest.mark.parametrize(
@@ -82,7 +63,7 @@ def test_should_check_that_list_is_flattened() -> None:
 
 
 @pytest.mark.vcr()
-def test_should_check_that_list_of_refs_is_fetched(list_of_all_refs: list[str]) -> None:
+def test_should_check_that_list_of_refs_is_fetched(list_of_all_refs: frozenset[str]) -> None:
     assert fetch_possible_refs() == list_of_all_refs
 
 
@@ -92,7 +73,7 @@ def test_should_check_intersection_of_two_lists() -> None:
         ("pts-vp-en", "7.9"),
         ("km", "2.2"),
     ]
-    accepted = ["bj", "pts-vp-en"]
+    accepted = frozenset(("bj", "pts-vp-en"))
     assert _filter_refs(references=some_refs, accepted_references=accepted) == [("pts-vp-en", "7.9")]
 
 
@@ -105,8 +86,8 @@ def test_should_check_intersection_of_two_lists() -> None:
             "lorem ipsum ",
             "test note for lorem ipsum",
             "vnp1.9, pts-vp-pli14.2",
-            "<p id='dn1:0.1'><a class='pts-vp-pli' id='pts-vp-pli14.2'>PTS-VP-PLI 14.2</a>lorem ipsum<a href='#note-{number}' id='noteref-{number}' role='doc-noteref' epub:type='noteref'>{number}</a> ",
-            ["pts-vp-pli"],
+            _EXPECTED_LINE_1,
+            frozenset({"pts-vp-pli"}),
         ),
         (
             "<h1 class='sutta-title'>{}</h1></header>",
@@ -114,10 +95,11 @@ def test_should_check_intersection_of_two_lists() -> None:
             "dolor sit. ",
             "test note for dolor sit",
             "invalid_ref, bj7.9",
-            "<h1 class='sutta-title'><a class='bj' id='bj7.9'>BJ 7.9</a>dolor sit.<a href='#note-{number}' id='noteref-{number}' role='doc-noteref' epub:type='noteref'>{number}</a> </h1></header>",
-            ["bj"],
+            _EXPECTED_LINE_2,
+            frozenset({"bj"}),
         ),
     ],
+    ids=["simple_p", "sutta_title"],
 )
 def test_should_check_that_a_full_mainmatter_item_is_processed(
     monkeypatch,
@@ -127,8 +109,8 @@ def test_should_check_that_a_full_mainmatter_item_is_processed(
     test_note: str,
     test_references: str,
     expected_line: str,
-    accepted_references: list[str],
-    list_of_all_refs: set[str],
+    accepted_references: frozenset[str],
+    list_of_all_refs: frozenset[str],
 ) -> None:
     monkeypatch.setattr("sutta_publisher.edition_parsers.helper_functions.ACCEPTED_REFERENCES", accepted_references)
     assert (
@@ -280,8 +262,8 @@ def test_validate_node(
     exception: bool,
 ):
     node_details = NodeDetails(
-        main_text=mainmatter["main_text"] if "main_text" in mainmatter else {},
-        markup=mainmatter["markup"] if "markup" in mainmatter else {},
+        main_text=mainmatter.get("main_text", {}),
+        markup=mainmatter.get("markup", {}),
     )
     node = Node(
         acronym=acronym,
@@ -307,7 +289,7 @@ def test_validate_node(
                     depth=1,
                     name="Foo1",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo1">Foo1</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo1">Foo1</h1>'),
                     type="frontmatter",
                     uid="foo1",
                 ),
@@ -316,7 +298,7 @@ def test_validate_node(
                     depth=1,
                     name="Foo2",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo2">Foo2</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo2">Foo2</h1>'),
                     type="branch",
                     uid="foo2",
                 ),
@@ -325,7 +307,7 @@ def test_validate_node(
                     depth=2,
                     name="Foo3",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo3">Foo3</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo3">Foo3</h1>'),
                     type="branch",
                     uid="foo3",
                 ),
@@ -334,7 +316,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo4",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo4">Foo4</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo4">Foo4</h1>'),
                     type="branch",
                     uid="foo4",
                 ),
@@ -343,7 +325,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo5",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo5">Foo5</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo5">Foo5</h1>'),
                     type="branch",
                     uid="foo5",
                 ),
@@ -352,7 +334,7 @@ def test_validate_node(
                     depth=2,
                     name="Foo6",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo6">Foo6</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo6">Foo6</h1>'),
                     type="branch",
                     uid="foo6",
                 ),
@@ -361,7 +343,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo7",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo7">Foo7</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo7">Foo7</h1>'),
                     type="branch",
                     uid="foo7",
                 ),
@@ -370,7 +352,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo8",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo8">Foo8</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo8">Foo8</h1>'),
                     type="branch",
                     uid="foo8",
                 ),
@@ -379,7 +361,7 @@ def test_validate_node(
                     depth=1,
                     name="Foo9",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo9">Foo9</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo9">Foo9</h1>'),
                     type="backmatter",
                     uid="foo9",
                 ),
@@ -393,7 +375,7 @@ def test_validate_node(
                     depth=1,
                     name="Foo1",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo1">Foo1</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo1">Foo1</h1>'),
                     type="frontmatter",
                     uid="foo1",
                 ),
@@ -402,7 +384,7 @@ def test_validate_node(
                     depth=1,
                     name="Foo2",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo2">Foo2</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo2">Foo2</h1>'),
                     type="branch",
                     uid="foo2",
                 ),
@@ -411,7 +393,7 @@ def test_validate_node(
                     depth=2,
                     name="Foo3",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo3">Foo3</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo3">Foo3</h1>'),
                     type="branch",
                     uid="foo3",
                 ),
@@ -420,7 +402,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo4",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo4">Foo4</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo4">Foo4</h1>'),
                     type="branch",
                     uid="foo4",
                 ),
@@ -429,7 +411,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo5",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo5">Foo5</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo5">Foo5</h1>'),
                     type="branch",
                     uid="foo5",
                 ),
@@ -438,7 +420,7 @@ def test_validate_node(
                     depth=2,
                     name="Foo6",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo6">Foo6</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo6">Foo6</h1>'),
                     type="branch",
                     uid="foo6",
                 ),
@@ -447,7 +429,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo7",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo7">Foo7</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo7">Foo7</h1>'),
                     type="branch",
                     uid="foo7",
                 ),
@@ -456,7 +438,7 @@ def test_validate_node(
                     depth=3,
                     name="Foo8",
                     root_name=None,
-                    tag=soup().new_tag('<h1 id="foo8">Foo8</h1>'),
+                    tag=_SOUP.new_tag('<h1 id="foo8">Foo8</h1>'),
                     type="branch",
                     uid="foo8",
                 ),